@@ -0,0 +1,810 @@
+"""
+Benchmarks del scraper de Mercado Libre.
+
+Uso:
+    python benchmark.py analytics [--products 10000] [--repeat 5]
+    python benchmark.py matching [--products 10000] [--repeat 5]
+    python benchmark.py records [--products 10000] [--repeat 5]
+    python benchmark.py serialization [--entries 500] [--repeat 5]
+    python benchmark.py parse [--fixtures fixtures] [--repeat 5]
+    python benchmark.py e2e [--fixtures fixtures] [--pages 5] [--latency-ms 50] [--error-rate 0.05] [--adaptive --max-rps 20]
+
+Herramientas de fixtures:
+    python benchmark.py record --query "iphone 13" [--pages 2] [--details]
+    python benchmark.py record --from-debug
+    python benchmark.py replay [--port 8765] [--latency-ms 50] [--error-rate 0.05]
+
+Los benchmarks de parseo y de punta a punta usan el corpus de fixtures
+grabado con `record`; si no existe, generan páginas sintéticas con la misma
+estructura de tarjetas.
+"""
+import argparse
+import difflib
+import glob
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+# Los logs del scraper van a stderr (stdout queda solo para el JSON); debe
+# configurarse antes de importar app, que si no configura su propio logging
+logging.basicConfig(level=logging.INFO, stream=sys.stderr,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+import app  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def analyze_products_legacy(products):
+    """Implementación original de analyze_products (varias pasadas en Python puro)"""
+    if not products:
+        return {
+            "cheapest": None,
+            "most_expensive": None,
+            "average_price": 0,
+            "total_products": 0,
+            "total_sales": 0
+        }
+
+    valid_products = [p for p in products if p['price'] > 0]
+
+    if not valid_products:
+        return {
+            "cheapest": None,
+            "most_expensive": None,
+            "average_price": 0,
+            "total_products": len(products),
+            "total_sales": sum(p.get('sales', 0) for p in products)
+        }
+
+    cheapest = min(valid_products, key=lambda x: x['price'])
+    most_expensive = max(valid_products, key=lambda x: x['price'])
+    total_price = sum(product['price'] for product in valid_products)
+    average_price = total_price / len(valid_products)
+    total_sales = sum(p.get('sales', 0) for p in products)
+
+    return {
+        "cheapest": cheapest,
+        "most_expensive": most_expensive,
+        "average_price": int(average_price),
+        "total_products": len(products),
+        "total_sales": total_sales
+    }
+
+
+def generate_products(count, seed=42):
+    """Genera productos sintéticos con una distribución de precios realista"""
+    rng = random.Random(seed)
+    sellers = [f"vendedor_{i}" for i in range(max(1, count // 50))]
+    products = []
+    for i in range(count):
+        # Algunos precios en cero (no parseados) y algunos accesorios muy baratos
+        roll = rng.random()
+        if roll < 0.02:
+            price = 0
+        elif roll < 0.07:
+            price = rng.randint(500, 3000)
+        else:
+            price = int(rng.lognormvariate(11, 0.3))
+        products.append({
+            'title': f"Producto de prueba {i}",
+            'price': price,
+            'seller': rng.choice(sellers),
+            'sales': rng.randint(0, 500),
+            'link': f"https://articulo.mercadolibre.com.ar/MLA-{1000000 + i}",
+            'image': ""
+        })
+    return products
+
+
+def time_call(func, args, repeat):
+    """Devuelve los tiempos (en segundos) de `repeat` ejecuciones de func(*args)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(timings):
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings)
+    }
+
+
+def bench_analytics(args):
+    products = generate_products(args.products)
+
+    legacy = analyze_products_legacy(products)
+    current = app.analyze_products(products)
+
+    # Los campos comunes deben coincidir con la implementación original
+    for key in ('average_price', 'total_products', 'total_sales'):
+        assert legacy[key] == current[key], f"{key}: {legacy[key]} != {current[key]}"
+    assert legacy['cheapest']['price'] == current['cheapest']['price']
+    assert legacy['most_expensive']['price'] == current['most_expensive']['price']
+
+    return {
+        "products": args.products,
+        "legacy": summarize(time_call(analyze_products_legacy, (products,), args.repeat)),
+        "vectorised": summarize(time_call(app.analyze_products, (products,), args.repeat))
+    }
+
+
+def build_product_dicts(products):
+    """Productos como diccionarios, con su registro de depuración (formato anterior)"""
+    rows = []
+    for i, p in enumerate(products):
+        # Cadenas nuevas por producto, como las que crea el parser
+        title, seller, link = ''.join(p['title']), ''.join(p['seller']), ''.join(p['link'])
+        rows.append({'title': title, 'price': p['price'], 'seller': seller, 'sales': p['sales'],
+                     'link': link, 'image': '', 'site': 'AR', 'currency': 'ARS'})
+        rows.append({'index': i, 'success': True, 'errors': [], 'title': title, 'link': link,
+                     'price': p['price'], 'image': '', 'seller': seller, 'sales': p['sales']})
+    return rows
+
+
+def build_product_records(products):
+    """Productos como app.Product"""
+    return [app.Product(''.join(p['title']), p['price'], ''.join(p['seller']), p['sales'],
+                        ''.join(p['link']), '', 'AR', 'ARS', None) for p in products]
+
+
+def build_product_batch(products):
+    """Productos en columnas (app.ProductBatch)"""
+    return app.ProductBatch.from_records(build_product_records(products))
+
+
+def bench_records(args):
+    products = generate_products(args.products)
+    results = {"products": args.products}
+    for name, build in (('dict', build_product_dicts), ('product', build_product_records),
+                        ('batch', build_product_batch)):
+        tracemalloc.start()
+        built = build(products)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        analysed = built[::2] if name == 'dict' else built
+        results[name] = {
+            "bytes_per_product": current / args.products,
+            "analyze": summarize(time_call(app.analyze_products, (analysed,), args.repeat))
+        }
+        del built, analysed
+    return results
+
+
+MATCHING_QUERIES = [
+    "iphone 13 128gb",
+    "zapatillas nike air max",
+    "cafetera expreso automatica",
+    "notebook lenovo ideapad 3",
+    "bicicleta rodado 29"
+]
+
+FILLER_WORDS = ["nuevo", "original", "oferta", "envio gratis", "garantia", "color negro", "pack x2", "liberado"]
+
+
+def generate_titles(query, count, rng):
+    """Genera títulos parecidos y no parecidos a la consulta"""
+    words = query.split()
+    titles = []
+    for _ in range(count):
+        roll = rng.random()
+        variant = list(words)
+        if roll < 0.2:
+            # Misma consulta con mayúsculas y acentos distintos
+            title = ' '.join(variant).title().replace('a', 'á', 1)
+        elif roll < 0.4:
+            # Consulta con algunas palabras de relleno
+            title = ' '.join(variant + rng.sample(FILLER_WORDS, rng.randint(1, 2)))
+        elif roll < 0.55:
+            # Palabras reordenadas
+            rng.shuffle(variant)
+            title = ' '.join(variant)
+        elif roll < 0.7:
+            # Error de tipeo en una palabra
+            idx = rng.randrange(len(variant))
+            word = variant[idx]
+            if len(word) > 3:
+                cut = rng.randrange(1, len(word) - 1)
+                variant[idx] = word[:cut] + word[cut + 1:]
+            title = ' '.join(variant)
+        else:
+            # Título de otra búsqueda
+            other = rng.choice([q for q in MATCHING_QUERIES if q != query])
+            title = ' '.join(other.split() + rng.sample(FILLER_WORDS, rng.randint(0, 3)))
+        titles.append(title)
+    return titles
+
+
+def legacy_exact_match(query, titles):
+    """Filtro original: un SequenceMatcher completo por título"""
+    return [difflib.SequenceMatcher(None, query.lower(), title.lower()).ratio() >= 0.7 for title in titles]
+
+
+def fast_exact_match(query, titles):
+    matcher = app.TitleMatcher(query, threshold=0.7)
+    return [matcher.matches(title) for title in titles]
+
+
+def bench_matching(args):
+    rng = random.Random(42)
+    per_query = max(1, args.products // len(MATCHING_QUERIES))
+    corpus = [(query, generate_titles(query, per_query, rng)) for query in MATCHING_QUERIES]
+
+    # Precisión respecto del criterio original (ratio >= 0.7)
+    agree = false_accepts = false_rejects = 0
+    stats = {}
+    for query, titles in corpus:
+        matcher = app.TitleMatcher(query, threshold=0.7)
+        for expected, title in zip(legacy_exact_match(query, titles), titles):
+            got = matcher.matches(title)
+            if got == expected:
+                agree += 1
+            elif got:
+                false_accepts += 1
+            else:
+                false_rejects += 1
+        for stage, count in matcher.stats.items():
+            stats[stage] = stats.get(stage, 0) + count
+
+    total = agree + false_accepts + false_rejects
+    # El filtro rápido debe decidir igual que el criterio original
+    assert false_accepts == false_rejects == 0, f"{false_accepts} aceptados y {false_rejects} rechazados de más"
+
+    def run(func):
+        for query, titles in corpus:
+            func(query, titles)
+
+    return {
+        "titles": total,
+        "accuracy": {
+            "agreement": agree / total,
+            "false_accepts": false_accepts,
+            "false_rejects": false_rejects
+        },
+        "decided_by_stage": stats,
+        "legacy": summarize(time_call(run, (legacy_exact_match,), args.repeat)),
+        "fast": summarize(time_call(run, (fast_exact_match,), args.repeat))
+    }
+
+
+# --- Corpus de fixtures -----------------------------------------------------
+
+MANIFEST = 'manifest.json'
+
+
+def is_listing_url(url):
+    """Las páginas de listado y de tienda se sirven distinto que las de detalle"""
+    host = urlparse(url).netloc
+    return host.startswith('listado.') or host.startswith('lista.') or '/tienda/' in url
+
+
+class Fixtures:
+    """Corpus de respuestas grabadas (páginas de listado y de detalle)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.entries = []
+        self.by_url = {}
+
+    @classmethod
+    def load(cls, directory):
+        fixtures = cls(directory)
+        path = os.path.join(directory, MANIFEST)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for entry in json.load(f)['entries']:
+                    fixtures._register(entry)
+        return fixtures
+
+    def _register(self, entry):
+        self.entries.append(entry)
+        if entry.get('url'):
+            self.by_url[self._key(entry['url'])] = entry
+
+    @staticmethod
+    def _key(url):
+        parsed = urlparse(url)
+        return parsed.netloc + parsed.path + (('?' + parsed.query) if parsed.query else '')
+
+    def add(self, kind, html, url=None):
+        """Guarda una respuesta en el corpus"""
+        if url and self._key(url) in self.by_url:
+            return self.by_url[self._key(url)]
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"{kind}_{len(self.of_kind(kind)) + 1:04d}.html"
+        with open(os.path.join(self.directory, name), 'w', encoding='utf-8') as f:
+            f.write(html)
+        entry = {'kind': kind, 'url': url, 'file': name}
+        self._register(entry)
+        return entry
+
+    def save(self):
+        with open(os.path.join(self.directory, MANIFEST), 'w', encoding='utf-8') as f:
+            json.dump({'entries': self.entries}, f, indent=2, ensure_ascii=False)
+
+    def of_kind(self, kind):
+        return [entry for entry in self.entries if entry['kind'] == kind]
+
+    def read(self, entry):
+        if 'html' in entry:
+            return entry['html']
+        with open(os.path.join(self.directory, entry['file']), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def lookup(self, url):
+        """
+        Busca la respuesta grabada para una URL. Las URLs no grabadas se
+        resuelven por tipo: los listados según el desplazamiento _Desde_ y los
+        detalles de forma estable según la URL.
+        """
+        entry = self.by_url.get(self._key(url))
+        if entry:
+            return entry
+        if is_listing_url(url):
+            candidates = self.of_kind('listing')
+            match = re.search(r'_Desde_(\d+)', url)
+            index = (int(match.group(1)) - 1) // 48 if match else 0
+        else:
+            candidates = self.of_kind('detail') or self.of_kind('listing')
+            index = int(hashlib.md5(url.encode('utf-8')).hexdigest(), 16)
+        if not candidates:
+            return None
+        return candidates[index % len(candidates)]
+
+
+def synthetic_card(i, rng):
+    price = int(rng.lognormvariate(11, 0.3))
+    sales = f'<span class="poly-component__sales">+{rng.randint(0, 500)} vendidos</span>' if rng.random() < 0.7 else ''
+    return (
+        '<li class="ui-search-layout__item"><div class="poly-card__content">'
+        f'<h3 class="poly-component__title-wrapper"><a href="https://articulo.mercadolibre.com.ar/MLA-{1000000000 + i}-producto-{i}-_JM" '
+        f'class="poly-component__title">Producto sintético número {i} color negro</a></h3>'
+        f'<span class="poly-component__seller">Por Vendedor{i % 37}</span>'
+        '<div class="poly-component__price"><div class="poly-price__current">'
+        f'<span class="andes-money-amount__fraction">{price:,}</span></div></div>'.replace(',', '.') +
+        f'{sales}<img data-src="https://http2.mlstatic.com/D_{i}.jpg"></div></li>'
+    )
+
+
+def synthetic_fixtures(pages=5, page_size=48, seed=42):
+    """Corpus en memoria con la estructura de tarjetas actual del sitio"""
+    rng = random.Random(seed)
+    fixtures = Fixtures(None)
+    for page in range(pages):
+        cards = ''.join(synthetic_card(page * page_size + i, rng) for i in range(page_size))
+        html = (
+            '<html><head><title>Listado</title></head><body>'
+            f'<span class="ui-search-search-result__quantity-results">{pages * page_size} resultados</span>'
+            f'<ol class="ui-search-layout">{cards}</ol></body></html>'
+        )
+        fixtures._register({'kind': 'listing', 'url': None, 'html': html})
+    for i in range(10):
+        html = f'<html><body><span class="ui-pdp-subtitle">Nuevo | +{rng.randint(1, 999)} vendidos</span></body></html>'
+        fixtures._register({'kind': 'detail', 'url': None, 'html': html})
+    return fixtures
+
+
+def load_fixtures(args):
+    fixtures = Fixtures.load(args.fixtures)
+    if not fixtures.of_kind('listing'):
+        print(f"No hay fixtures en '{args.fixtures}', usando páginas sintéticas", file=sys.stderr)
+        fixtures = synthetic_fixtures()
+    return fixtures
+
+
+def record_fixtures(args):
+    """Graba respuestas reales (o importa debug_page_*.html) al corpus"""
+    fixtures = Fixtures.load(args.fixtures)
+    before = len(fixtures.entries)
+
+    if args.from_debug:
+        # Páginas guardadas por scrape_mercado_libre con save_debug
+        def page_number(path):
+            return int(re.search(r'(\d+)', os.path.basename(path)).group(1))
+        for path in sorted(glob.glob('debug_page_*.html'), key=page_number):
+            with open(path, 'r', encoding='utf-8') as f:
+                fixtures.add('listing', f.read())
+    else:
+        if not args.query:
+            raise SystemExit("record necesita --query o --from-debug")
+
+        def recorder(url):
+            html = app.get_html(url)
+            fixtures.add('listing' if is_listing_url(url) else 'detail', html, url)
+            return html
+
+        app.scrape_mercado_libre(args.query, max_pages=args.pages, max_products=args.products,
+                                 deep_sales_search=args.details, fetcher=recorder,
+                                 save_debug=False, resume=False, site=args.site)
+
+    fixtures.save()
+    return {
+        "directory": args.fixtures,
+        "recorded": len(fixtures.entries) - before,
+        "listing": len(fixtures.of_kind('listing')),
+        "detail": len(fixtures.of_kind('detail'))
+    }
+
+
+# --- Servidor de replay -------------------------------------------------------
+
+class ReplayServer:
+    """
+    Servidor HTTP local que sirve el corpus de fixtures con latencia y
+    errores (429/5xx) configurables. Con max_rps responde 429 a las
+    solicitudes que superan esa tasa en el último segundo, como un sitio que
+    limita a los clientes. Las rutas tienen la forma
+    /<host original>/<ruta original>.
+    """
+
+    def __init__(self, fixtures, port=0, latency_ms=0, jitter_ms=0, error_rate=0.0,
+                 error_codes=(429, 500, 503), seed=42, max_rps=0):
+        self.fixtures = fixtures
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_codes = error_codes
+        self.max_rps = max_rps
+        self.recent = []
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": {}, "not_found": 0}
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def handle(self, request):
+        with self.lock:
+            self.stats["requests"] += 1
+            delay = (self.latency_ms + self.rng.uniform(0, self.jitter_ms)) / 1000
+            error = self.rng.choice(self.error_codes) if self.rng.random() < self.error_rate else None
+            if self.max_rps:
+                now = time.monotonic()
+                self.recent = [ts for ts in self.recent if ts > now - 1]
+                if len(self.recent) >= self.max_rps:
+                    error = 429
+                else:
+                    self.recent.append(now)
+        if delay:
+            time.sleep(delay)
+
+        if error:
+            with self.lock:
+                self.stats["errors"][str(error)] = self.stats["errors"].get(str(error), 0) + 1
+            request.send_response(error)
+            if error == 429:
+                request.send_header('Retry-After', '1')
+            request.end_headers()
+            return
+
+        entry = self.fixtures.lookup('https:/' + request.path)
+        if entry is None:
+            with self.lock:
+                self.stats["not_found"] += 1
+            request.send_response(404)
+            request.end_headers()
+            return
+
+        body = self.fixtures.read(entry).encode('utf-8')
+        request.send_response(200)
+        request.send_header('Content-Type', 'text/html; charset=utf-8')
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Redirige las solicitudes de una sesión de requests al servidor de replay"""
+
+    def __init__(self, base_url, **kwargs):
+        self.base_url = base_url
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        parsed = urlparse(request.url)
+        request.url = f"{self.base_url}/{parsed.netloc}{parsed.path}" + (f"?{parsed.query}" if parsed.query else '')
+        kwargs['proxies'] = None
+        return super().send(request, **kwargs)
+
+
+def use_replay_server(base_url):
+    """Hace que las sesiones del RequestManager hablen con el servidor de replay"""
+    def new_session(manager):
+        session = app.requests.Session()
+        adapter = ReplayAdapter(base_url, pool_connections=manager.pool_size, pool_maxsize=manager.pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    app.RequestManager._new_session = new_session
+    if app.request_manager is not None:
+        app.request_manager.session = app.request_manager._new_session()
+
+
+def add_server_arguments(parser):
+    parser.add_argument('--port', type=int, default=8765, help="Puerto del servidor de replay")
+    parser.add_argument('--latency-ms', type=float, default=0, help="Latencia fija por respuesta")
+    parser.add_argument('--jitter-ms', type=float, default=0, help="Latencia aleatoria adicional máxima")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fracción de respuestas con error 429/5xx")
+    parser.add_argument('--max-rps', type=float, default=0, help="Solicitudes por segundo que tolera el servidor (más allá responde 429)")
+
+
+def run_replay(args):
+    server = ReplayServer(load_fixtures(args), port=args.port, latency_ms=args.latency_ms,
+                          jitter_ms=args.jitter_ms, error_rate=args.error_rate, max_rps=args.max_rps)
+    print(f"Sirviendo fixtures en {server.base_url}/<host>/<ruta> (Ctrl+C para terminar)", file=sys.stderr)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return server.stats
+
+
+# --- Benchmarks de parseo y de punta a punta ---------------------------------
+
+def extract_card(card):
+    """Extracción de campos de una tarjeta, como en scrape_mercado_libre"""
+    app.extract_title_and_link(card)
+    app.extract_price_from_html(card)
+    app.extract_seller_info(card)
+    app.extract_sales_count(card)
+
+
+def bench_parse(args):
+    fixtures = load_fixtures(args)
+    pages = []
+    parse_times = []
+    card_times = []
+
+    for entry in fixtures.of_kind('listing'):
+        html = fixtures.read(entry)
+        parse = summarize(time_call(lambda: BeautifulSoup(html, 'html.parser'), (), args.repeat))
+        soup = BeautifulSoup(html, 'html.parser')
+        find = summarize(time_call(app.find_product_cards, (soup,), args.repeat))
+        cards, _, _ = app.dedupe_cards(app.find_product_cards(soup), set())
+        if not cards:
+            continue
+
+        extract = summarize(time_call(lambda: [extract_card(card) for card in cards], (), args.repeat))
+        per_card = extract['median'] / len(cards)
+        parse_times.append(parse['median'])
+        card_times.append(per_card)
+        pages.append({
+            "fixture": entry.get('file') or entry.get('url'),
+            "bytes": len(html.encode('utf-8')),
+            "cards": len(cards),
+            "parse": parse,
+            "find_cards": find,
+            "extract_per_card": per_card
+        })
+
+    return {
+        "pages": pages,
+        "parse_per_page_median": statistics.median(parse_times) if parse_times else None,
+        "extract_per_card_median": statistics.median(card_times) if card_times else None
+    }
+
+
+def build_cache(entries):
+    """Caché de solicitudes como la de RequestManager, con páginas de listado sintéticas"""
+    pages = [fixture['html'] for fixture in synthetic_fixtures(pages=5).of_kind('listing')]
+    now = time.time()
+    return {
+        f"https://listado.mercadolibre.com.ar/producto-{i}_Desde_{i * 50 + 1}_NoIndex_True": {
+            'content': pages[i % len(pages)], 'timestamp': now - i
+        }
+        for i in range(entries)
+    }
+
+
+def stdlib_save(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+
+
+def stdlib_load(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def bench_serialization(args):
+    cache = build_cache(args.entries)
+    results = {"entries": args.entries, "backend": 'orjson' if app.orjson is not None else 'json'}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, save, load in (('stdlib', stdlib_save, stdlib_load),
+                                 ('app', app.write_json, app.read_json)):
+            path = os.path.join(tmp, f'{name}.json')
+            save_timings = time_call(save, (path, cache), args.repeat)
+            load_timings = time_call(load, (path,), args.repeat)
+            assert load(path) == cache
+            results[name] = {
+                "bytes": os.path.getsize(path),
+                "save": summarize(save_timings),
+                "load": summarize(load_timings)
+            }
+    return results
+
+
+def bench_e2e(args):
+    fixtures = load_fixtures(args)
+    server = ReplayServer(fixtures, port=0, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                          error_rate=args.error_rate, max_rps=args.max_rps).start()
+
+    # Sin esperas artificiales: se mide el scraper, no el rate limiting. Con
+    # --adaptive el control AIMD por host decide la tasa y la concurrencia
+    app.CONFIG.update({
+        'delay_min': 0,
+        'delay_max': 0,
+        'max_requests_per_minute': 1000000,
+        'use_adaptive_delay': args.adaptive,
+        'enable_proxy': False,
+        'parse_processes': args.parse_processes,
+        'cache_file': os.path.join(tempfile.gettempdir(), 'mercado_libre_bench_cache.json')
+    })
+    app.init_components()
+    use_replay_server(server.base_url)
+
+    def run():
+        app.request_manager.cache = {}
+        query = args.query or 'producto'
+        if args.batch > 1:
+            # Lote de búsquedas: los fixtures se sirven por offset de página
+            batch = app.batch_scrape([f"{query} {i + 1}" for i in range(args.batch)], max_pages=args.pages,
+                                     max_products=args.products, deep_sales_search=args.details, site=args.site)
+            results = [r for r in batch['results'] if r['performance']]
+            return ([p for r in results for p in r['products']],
+                    {'pages_scraped': sum(r['performance']['pages_scraped'] for r in results)})
+        return app.scrape_mercado_libre(query, max_pages=args.pages,
+                                        max_products=args.products, deep_sales_search=args.details,
+                                        save_debug=False, resume=False, site=args.site)
+
+    try:
+        runs = []
+        for _ in range(args.repeat):
+            requests_before = server.stats["requests"]
+            start = time.perf_counter()
+            products, performance = run()
+            elapsed = time.perf_counter() - start
+            runs.append({
+                "seconds": elapsed,
+                "products": len(products),
+                "pages": performance['pages_scraped'],
+                "requests": server.stats["requests"] - requests_before
+            })
+
+        # Memoria en una ejecución aparte: tracemalloc distorsiona los tiempos
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        server.stop()
+        if app.parse_pool is not None:
+            app.parse_pool.shutdown()
+
+    seconds = [r['seconds'] for r in runs]
+    best = min(runs, key=lambda r: r['seconds'])
+    return {
+        "config": {
+            "pages": args.pages,
+            "batch": args.batch,
+            "parse_processes": args.parse_processes,
+            "deep_sales_search": args.details,
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "max_rps": args.max_rps,
+            "adaptive": args.adaptive
+        },
+        "hosts": app.request_manager.controller.stats() if args.adaptive else None,
+        "time": summarize(seconds),
+        "products_per_second": best['products'] / best['seconds'] if best['seconds'] else None,
+        "pages_per_second": best['pages'] / best['seconds'] if best['seconds'] else None,
+        "runs": runs,
+        "server": server.stats,
+        "memory": {
+            "tracemalloc_peak_mb": peak / 2 ** 20,
+            "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource else None
+        }
+    }
+
+
+BENCHMARKS = {
+    'analytics': bench_analytics,
+    'matching': bench_matching,
+    'records': bench_records,
+    'serialization': bench_serialization,
+    'parse': bench_parse,
+    'e2e': bench_e2e
+}
+
+TOOLS = {
+    'record': record_fixtures,
+    'replay': run_replay
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks del scraper de Mercado Libre")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS) + sorted(TOOLS))
+    parser.add_argument('--products', type=int, default=10000, help="Cantidad de productos sintéticos (o máximo a scrapear)")
+    parser.add_argument('--entries', type=int, default=500, help="Páginas en la caché del benchmark de serialización")
+    parser.add_argument('--repeat', type=int, default=5, help="Repeticiones por medición")
+    parser.add_argument('--fixtures', default='fixtures', help="Carpeta del corpus de fixtures")
+    parser.add_argument('--query', help="Búsqueda a grabar o a ejecutar contra el replay")
+    parser.add_argument('--site', default=None, help="Código de país (ver SITES)")
+    parser.add_argument('--pages', type=int, default=5, help="Páginas de listado a grabar o scrapear")
+    parser.add_argument('--details', action='store_true', help="Incluir páginas de detalle (búsqueda profunda de ventas)")
+    parser.add_argument('--from-debug', action='store_true', help="Importar debug_page_*.html como fixtures")
+    parser.add_argument('--output', help="Archivo donde guardar también el resultado JSON")
+    parser.add_argument('--batch', type=int, default=1, help="Búsquedas por ejecución en e2e (más de 1 usa batch_scrape)")
+    parser.add_argument('--adaptive', action='store_true', help="Usar el control adaptativo por host en e2e (CONFIG['use_adaptive_delay'])")
+    parser.add_argument('--parse-processes', type=int, default=0, help="Procesos del pool de parseo en e2e (CONFIG['parse_processes'])")
+    add_server_arguments(parser)
+    args = parser.parse_args()
+
+    if args.benchmark in BENCHMARKS:
+        app.logger.setLevel(logging.WARNING)
+
+    if args.benchmark in TOOLS:
+        results = TOOLS[args.benchmark](args)
+    else:
+        results = BENCHMARKS[args.benchmark](args)
+    report = {"benchmark": args.benchmark, "timestamp": time.time(), "results": results}
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
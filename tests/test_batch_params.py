@@ -0,0 +1,25 @@
+import pytest
+
+import app
+
+
+def test_batch_params_are_converted():
+    planned = app._normalize_batch_queries(
+        [{'search_query': 'funda', 'min_price': '100', 'exact_match': 'false', 'deep_sales_search': 1}],
+        {'max_pages': 2.0, 'min_sales': '5'})
+    assert planned == [{'max_pages': 2, 'min_sales': 5, 'min_price': 100, 'exact_match': False,
+                        'deep_sales_search': True, 'max_products': app.CONFIG['max_products'],
+                        'search_query': 'funda'}]
+
+
+@pytest.mark.parametrize('body', [
+    {'queries': ['funda'], 'filters': {'min_price': 'abc'}},
+    {'queries': ['funda'], 'filters': {'max_pages': -1}},
+    {'queries': [{'search_query': 'funda', 'exact_match': 'quizas'}]},
+    {'queries': ['funda'], 'filters': ['min_price']},
+    {'queries': [3]},
+])
+def test_batch_search_rejects_invalid_params(body):
+    response = app.app.test_client().post('/batch_search', json=body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
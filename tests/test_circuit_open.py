@@ -0,0 +1,42 @@
+import app
+
+
+def test_circuit_open_is_reported_in_performance_data():
+    app.CONFIG['checkpoint_enabled'] = False
+
+    def fetcher(url):
+        raise app.CircuitOpenError('listado.mercadolibre.com.ar', 42.0)
+
+    products, performance = app.scrape_mercado_libre('funda', max_pages=3, fetcher=fetcher, save_debug=False)
+    assert products == []
+    assert performance['interrupted_at_page'] == 1
+    assert performance['circuit_open'] == {'host': 'listado.mercadolibre.com.ar', 'retry_after': 42.0}
+
+
+CARD = '''<li class="ui-search-layout__item"><div class="poly-card__content">
+<h3 class="poly-component__title-wrapper"><a href="https://articulo.mercadolibre.com.ar/MLA-10000{i}-funda_JM"
+ class="poly-component__title">Funda celular {i}</a></h3>
+<span class="poly-component__seller">Por TiendaX</span>
+<div class="poly-component__price"><div class="poly-price__current">
+<span class="andes-money-amount__fraction">1.500</span></div></div></div></li>'''
+PAGE = '<html><body><ol class="ui-search-layout">%s</ol></body></html>' % ''.join(CARD.format(i=i) for i in range(1, 4))
+
+
+def test_circuit_open_on_detail_page_interrupts_and_keeps_journal(tmp_path, monkeypatch):
+    monkeypatch.setitem(app.CONFIG, 'checkpoint_enabled', True)
+    monkeypatch.setitem(app.CONFIG, 'checkpoint_dir', str(tmp_path))
+
+    def fetcher(url):
+        if 'articulo' in url:
+            raise app.CircuitOpenError('articulo.mercadolibre.com.ar', 30.0)
+        return PAGE
+
+    products, performance = app.scrape_mercado_libre('funda', max_pages=2, deep_sales_search=True,
+                                                     fetcher=fetcher, save_debug=False)
+    assert products == []
+    assert performance['interrupted_at_page'] == 1
+    assert performance['circuit_open'] == {'host': 'articulo.mercadolibre.com.ar', 'retry_after': 30.0}
+    # La página quedó sin anotar: el diario sigue para retomarla
+    journals = list(tmp_path.glob('crawl_*.jsonl'))
+    assert len(journals) == 1
+    assert '"type":"page"' not in journals[0].read_text()
@@ -0,0 +1,52 @@
+import threading
+from concurrent.futures import CancelledError
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def slow_pool(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def get_html(url, use_cache=True, retry=True):
+        calls.append(url)
+        started.set()
+        release.wait(5)
+        return '<html>%s</html>' % url
+
+    monkeypatch.setattr(app, 'get_html', get_html)
+    pool = app.FetchPool(max_workers=2)
+    yield pool, started, release, calls
+    release.set()
+    pool.shutdown()
+
+
+def test_cancel_by_one_caller_keeps_shared_download(slow_pool):
+    pool, started, release, calls = slow_pool
+    first = pool.submit('https://x/1')
+    second = pool.submit('https://x/1')
+    assert first is not second
+    assert started.wait(5)
+
+    assert first.cancel()
+    release.set()
+    assert second.result(5) == '<html>https://x/1</html>'
+    with pytest.raises(CancelledError):
+        first.result()
+    assert calls == ['https://x/1']
+    assert pool.stats['deduplicated'] == 1
+
+
+def test_cancel_by_last_caller_cancels_pending_download(slow_pool):
+    pool, started, release, calls = slow_pool
+    blockers = [pool.submit('https://x/a'), pool.submit('https://x/b')]
+    pending = pool.submit('https://x/c')
+    assert pending.cancel()
+    release.set()
+    assert [future.result(5) for future in blockers]
+    assert 'https://x/c' not in calls
+    assert pool._in_flight == {}
@@ -0,0 +1,47 @@
+import random
+import time
+
+import pytest
+
+import app
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    monkeypatch.setitem(app.CONFIG, 'delay_min', 0.2)
+    monkeypatch.setitem(app.CONFIG, 'delay_max', 0.2)
+    monkeypatch.setitem(app.CONFIG, 'aimd_max_rate', 5.0)
+    monkeypatch.setattr(app, 'is_low_traffic_hour', lambda: False)
+    return app.HostController()
+
+
+def send(controller, key=('', 'listado.mercadolibre.com.ar')):
+    """Turno como el de acquire, sin esperar el ritmo de la tasa"""
+    with controller._cond:
+        controller._get(key)['in_flight'] += 1
+    return key, time.monotonic()
+
+
+def test_latency_jitter_does_not_reduce_rate(controller):
+    rng = random.Random(1)
+    for _ in range(500):
+        controller.success(send(controller), 0.05 + rng.uniform(0, 0.15))
+    state = controller.stats()[0]
+    assert state['rate'] == pytest.approx(5.0)
+    assert state['concurrency'] == app.CONFIG['aimd_max_concurrency']
+
+
+def test_sustained_latency_rise_reduces_rate(controller):
+    rng = random.Random(2)
+    for _ in range(100):
+        controller.success(send(controller), 0.05 + rng.uniform(0, 0.15))
+    for _ in range(10):
+        controller.success(send(controller), 1.0)
+    assert controller.stats()[0]['rate'] < 5.0
+
+
+def test_single_slow_response_does_not_reduce_rate(controller):
+    for _ in range(100):
+        controller.success(send(controller), 0.1)
+    controller.success(send(controller), 2.0)
+    assert controller.stats()[0]['rate'] == pytest.approx(5.0)
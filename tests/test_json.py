@@ -0,0 +1,9 @@
+import json
+
+import app
+
+
+def test_product_serializes_through_to_dict():
+    product = app.Product('Funda', 100, 'TiendaX', 3, 'https://x', None, 'AR', 'ARS', None)
+    assert json.loads(app.to_json([product])) == [product.to_dict()]
+    assert 'price_usd' not in json.loads(app.to_json(product))
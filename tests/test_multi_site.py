@@ -0,0 +1,34 @@
+import pytest
+
+import app
+
+
+@pytest.mark.parametrize('body', [
+    {'search_query': 'funda', 'filters': ['min_price']},
+    {'search_query': 'funda', 'filters': {'max_pages': 'dos'}},
+    {'search_query': 'funda', 'filters': {'deep_sales_search': 'quizas'}},
+    {'search_query': 'funda', 'sites': ['AR', 3]},
+    {'search_query': 'funda', 'sites': 'AR'},
+    {'search_query': 'funda', 'sites': ['XX']},
+])
+def test_multi_site_search_rejects_invalid_input(body):
+    response = app.app.test_client().post('/multi_site_search', json=body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_multi_site_converts_filters_and_dedupes_sites(monkeypatch):
+    calls = []
+
+    def scrape(search_query, site=None, save_debug=True, **kwargs):
+        calls.append((site, kwargs))
+        return [], {}
+
+    monkeypatch.setattr(app, 'scrape_mercado_libre', scrape)
+    response = app.app.test_client().post('/multi_site_search', json={
+        'search_query': 'funda', 'sites': ['AR', 'ar', ' MX'],
+        'filters': {'min_price': '100', 'deep_sales_search': 'false', 'max_pages': '2'}})
+    assert response.status_code == 200
+    assert sorted(site for site, _ in calls) == ['AR', 'MX']
+    assert all(kwargs == {'min_price': 100, 'deep_sales_search': False, 'max_pages': 2} for _, kwargs in calls)
+    assert response.get_json()['report']['sites'] == ['AR', 'MX']
@@ -0,0 +1,18 @@
+import app
+
+
+def test_unexpected_health_check_error_does_not_stick(monkeypatch):
+    manager = app.ProxyManager({'type': 'list', 'list': ['http://10.0.0.1:8080']})
+    state = manager.states[0]
+    state.quarantined = True
+    state.checking = True
+
+    def broken(*args, **kwargs):
+        raise ValueError('encabezados inválidos')
+
+    monkeypatch.setattr(app, 'get_random_headers', broken)
+    manager._health_check(state)
+
+    # Sigue en cuarentena, pero la próxima revisión puede volver a comprobarlo
+    assert state.checking is False
+    assert state.quarantined is True
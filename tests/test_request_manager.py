@@ -0,0 +1,66 @@
+import pytest
+
+import app
+
+
+class Response:
+    status_code = 200
+    text = '<html></html>'
+    headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    for key, value in {'delay_min': 0.0, 'delay_max': 0.0, 'use_adaptive_delay': True, 'retry_max_attempts': 0,
+                       'circuit_failure_threshold': 1, 'circuit_open_seconds': 0.0}.items():
+        monkeypatch.setitem(app.CONFIG, key, value)
+    monkeypatch.setattr(app, 'proxy_manager', None)
+    manager = app.RequestManager(max_requests_per_minute=1000, cache_file=str(tmp_path / 'cache.json'))
+    monkeypatch.setattr(manager.session, 'get', lambda url, **kwargs: Response())
+    return manager
+
+
+def in_flight(manager):
+    return sum(state['in_flight'] for state in manager.controller.hosts.values())
+
+
+def test_failure_before_sending_releases_probe_and_turn(manager, monkeypatch):
+    host = 'listado.mercadolibre.com.ar'
+    manager.breaker.record_failure(host)
+    assert manager.breaker.hosts[host]['state'] == manager.breaker.OPEN
+
+    # Falla antes de session.get: se libera la prueba del circuito sin contar un error
+    monkeypatch.setattr(app, 'get_random_headers', lambda site=None: {})
+    monkeypatch.setattr(manager, '_rate_limit', lambda *args: (_ for _ in ()).throw(RuntimeError('rate limit')))
+    with pytest.raises(RuntimeError):
+        manager.get('https://%s/a' % host, cache=False, retry=False)
+    state = manager.breaker.hosts[host]
+    assert state['probing'] is False
+    assert state['failures'] == 1
+    assert manager.breaker.before_request(host) is True
+
+
+def test_error_after_success_is_not_recorded_as_failure(manager, monkeypatch):
+    def broken_save():
+        raise OSError('disco lleno')
+
+    monkeypatch.setattr(manager, '_save_cache', broken_save)
+    with pytest.raises(OSError):
+        manager.get('https://listado.mercadolibre.com.ar/b', retry=False)
+    assert in_flight(manager) == 0
+    state = manager.breaker.hosts['listado.mercadolibre.com.ar']
+    assert state['state'] == manager.breaker.CLOSED
+    assert state['failures'] == 0
+
+
+def test_controller_turn_is_released_when_request_is_interrupted(manager, monkeypatch):
+    manager.get('https://listado.mercadolibre.com.ar/c', cache=False, retry=False)
+    assert in_flight(manager) == 0
+
+    monkeypatch.setattr(manager.session, 'get', lambda url, **kwargs: (_ for _ in ()).throw(KeyboardInterrupt()))
+    with pytest.raises(KeyboardInterrupt):
+        manager.get('https://listado.mercadolibre.com.ar/d', cache=False, retry=False)
+    assert in_flight(manager) == 0
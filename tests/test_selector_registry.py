@@ -0,0 +1,53 @@
+import app
+
+CARD = '''<li class="ui-search-layout__item"><div class="poly-card__content">
+<h3 class="poly-component__title-wrapper"><a href="https://articulo.mercadolibre.com.ar/MLA-10000{i}-producto_JM"
+ class="poly-component__title">Producto de prueba {i}</a></h3>
+<span class="poly-component__seller">Por TiendaX</span>
+<div class="poly-component__price"><div class="poly-price__current">
+<span class="andes-money-amount__fraction">1.{i}00</span></div></div>
+<span class="poly-component__sales">{i} vendidos</span></div></li>'''
+PAGE = '<html><body><ol class="ui-search-layout">%s</ol></body></html>' % ''.join(CARD.format(i=i) for i in range(1, 6))
+
+
+def summary(registry):
+    stats = registry.stats()
+    return ({group: data['lookups'] for group, data in stats.items()},
+            {(group, s['selector']): s['hits'] for group, data in stats.items() for s in data['selectors']},
+            registry.context_stats())
+
+
+def test_pool_usage_merges_like_local_parse(monkeypatch):
+    local = app.SelectorRegistry.load()
+    monkeypatch.setattr(app, 'selector_registry', local)
+    expected = app.parse_listing_page(PAGE, site='AR')
+    assert expected['selector_usage'] is None
+
+    # Simula un proceso de ParsePool: registro propio y uso devuelto con la página
+    worker = app.SelectorRegistry.load()
+    monkeypatch.setattr(app, 'selector_registry', worker)
+    result = app.parse_listing_page(PAGE, site='AR', track_selectors=True)
+    assert result['cards'] == expected['cards']
+
+    parent = app.SelectorRegistry.load()
+    parent.merge_usage('listing', 'AR', result['layout'], result['selector_usage'])
+    assert summary(parent) == summary(local)
+    assert summary(parent)[0]['price'] == 5
+
+
+def test_export_keeps_layout_overrides(tmp_path):
+    layouts = dict(app.LAYOUT_TABLE)
+    layouts['nueva'] = {'markers': [['div', 'nueva-card']], 'selectors': {'card': ['li.ui-search-layout__item']}}
+    registry = app.SelectorRegistry(app.SELECTOR_TABLE, app.PATTERN_TABLE, layouts)
+    path = str(tmp_path / 'selectors.json')
+    registry.export(path)
+
+    data = app.read_json(path)
+    assert list(data['layouts']) == ['nueva']
+    reloaded = app.SelectorRegistry.load(path)
+    assert reloaded.layouts['nueva'] == layouts['nueva']
+    assert set(reloaded.layouts) == set(layouts)
+
+    # Sin estructuras propias no se escribe la clave
+    app.SelectorRegistry.load().export(path)
+    assert 'layouts' not in app.read_json(path)
@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+import app
+
+
+def test_similar_titles_group_fuzzily_but_keep_models_apart():
+    titles = ['Apple iPhone 13 128GB Azul', 'iPhone 13 128 GB Azul Liberado Apple', 'Apple iPhone 14 128GB Azul',
+              'Funda iphone 13', 'Cargador iphone 13']
+    prices = np.array([1000.0, 1100.0, 1500.0, 10.0, 20.0])
+    sales = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    group_prices, group_sales = app._group_similar_titles(prices, sales, titles)
+    assert sorted(group_prices.tolist()) == [10.0, 20.0, 1050.0, 1500.0]
+    assert sorted(group_sales.tolist()) == [3.0, 3.0, 4.0, 5.0]
+
+
+def test_estimate_accepts_text_values():
+    products = [{'title': 'a', 'price': '100', 'sales': '3'}, {'title': 'b', 'price': 200, 'sales': None},
+                {'title': 'c', 'price': 'n/d'}]
+    estimate = app.estimate_suggested_price(products, group_duplicates=False)
+    assert estimate['input_products'] == 2
+    assert estimate['median'] == 150
+
+
+def test_group_duplicates_false_string_is_false():
+    products = [{'title': 'Funda iphone 13', 'price': 100}, {'title': 'funda IPHONE 13', 'price': 300}]
+    response = app.app.test_client().post('/suggested_price', json={'products': products, 'group_duplicates': 'false'})
+    assert response.status_code == 200
+    assert response.get_json()['groups'] is None
+
+
+@pytest.mark.parametrize('body', [
+    {'products': 'x'},
+    {'products': [1, 2]},
+    {'products': [{'price': 100}], 'trim_ratio': 'mucho'},
+    {'products': [{'price': 100}], 'group_duplicates': 'quizas'},
+])
+def test_suggested_price_rejects_invalid_input(body):
+    response = app.app.test_client().post('/suggested_price', json=body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
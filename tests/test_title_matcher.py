@@ -0,0 +1,53 @@
+import difflib
+import random
+
+import pytest
+
+import app
+
+VOCABULARY = ['la', 'para', 'con', 'de', 'el', 'a', 'x', 'y', 'max', 'iphone', 'Pro', 'pro', 'funda', 'samsung',
+              'galaxy', 's23', '128gb', 'camión', 'camion', 'ñandú', 'Azul', '-', ',', '!', '13']
+
+
+def legacy_matches(query, title, threshold=0.7):
+    return difflib.SequenceMatcher(None, query.lower(), title.lower()).ratio() >= threshold
+
+
+@pytest.mark.parametrize('query, title', [
+    ('con', 'la'),
+    ('la para', 'la para max'),
+    ('para y camión', 'camión para de'),
+    ('la', '- ,'),
+    ('iPhone 13 Pro', 'iphone 13 pro'),
+    ('iphone 13 pro', 'Funda iPhone 13 Pro Max Silicona'),
+    ('samsung galaxy s23', 'Samsung Galaxy S23 128gb Negro'),
+])
+def test_known_pairs_match_legacy_rule(query, title):
+    assert app.TitleMatcher(query, threshold=0.7).matches(title) == legacy_matches(query, title)
+
+
+def test_randomized_word_parity():
+    rng = random.Random(28)
+
+    def phrase():
+        return ' '.join(rng.choice(VOCABULARY) for _ in range(rng.randint(0, 6)))
+
+    for _ in range(5000):
+        query, title = phrase(), phrase()
+        if rng.random() < 0.3:
+            title = query + rng.choice(['', ' pro', ' de', ',', ' X'])
+        assert app.TitleMatcher(query, threshold=0.7).matches(title) == legacy_matches(query, title), (query, title)
+
+
+def test_randomized_character_parity():
+    rng = random.Random(29)
+    for _ in range(20000):
+        query = ''.join(rng.choice('ab c') for _ in range(rng.randint(1, 12)))
+        title = ''.join(rng.choice('ab c') for _ in range(rng.randint(1, 12)))
+        assert app.TitleMatcher(query, threshold=0.7).matches(title) == legacy_matches(query, title), (query, title)
+
+
+def test_repeated_titles_reuse_result():
+    matcher = app.TitleMatcher('iphone 13', threshold=0.7)
+    assert [matcher.matches('iPhone 13'), matcher.matches('IPHONE 13')] == [True, True]
+    assert matcher.stats['repeated'] == 1